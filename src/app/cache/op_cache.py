@@ -0,0 +1,85 @@
+import asyncio
+import time
+from typing import Any, Awaitable, Callable
+
+import asyncpg
+
+from src.app.database.queries.bots import BotActions
+from src.app.database.queries.channels import ChannelActions
+
+OP_CACHE_TTL = 60
+
+_channels: list = []
+_bots: list = []
+_active_channels: list = []
+_active_bots: list = []
+_expires_at: float = 0
+_generation: int = 0
+_in_flight: dict[str, asyncio.Task] = {}
+
+
+async def _single_flight(key: str, coro_factory: Callable[[], Awaitable[Any]]) -> Any:
+    task = _in_flight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(coro_factory())
+        _in_flight[key] = task
+        task.add_done_callback(lambda done: _on_flight_done(key, done))
+
+    # Запрос выполняется в отдельной задаче: отмена одного ожидающего не отменяет общий запрос
+    return await asyncio.shield(task)
+
+
+def _on_flight_done(key: str, task: asyncio.Task) -> None:
+    if _in_flight.get(key) is task:
+        del _in_flight[key]
+    if not task.cancelled():
+        task.exception()  # помечаем как полученное, если ожидающих нет
+
+
+async def _fetch(pool: asyncpg.Pool) -> tuple[list, list, list, list]:
+    global _channels, _bots, _active_channels, _active_bots, _expires_at
+
+    generation = _generation
+    channel_actions = ChannelActions(pool)
+    bot_actions = BotActions(pool)
+    result = tuple(await asyncio.gather(
+        channel_actions.get_all_channels(),
+        bot_actions.get_all_bots(),
+        channel_actions.get_active_op_channels(),
+        bot_actions.get_active_op_bots(),
+    ))
+    # Если кэш сбросили во время запроса, не сохраняем результат в кэш,
+    # но ожидающим всё равно отдаём свежие строки, а не старые глобальные значения
+    if generation == _generation:
+        _channels, _bots, _active_channels, _active_bots = result
+        _expires_at = time.monotonic() + OP_CACHE_TTL
+    return result
+
+
+async def _load(pool: asyncpg.Pool) -> tuple[list, list, list, list]:
+    if time.monotonic() <= _expires_at:
+        return _channels, _bots, _active_channels, _active_bots
+    # Ключ зависит от поколения: после invalidate() не присоединяемся к запросу, начатому до сброса
+    return await _single_flight(f"op:{_generation}", lambda: _fetch(pool))
+
+
+async def get_channels(pool: asyncpg.Pool) -> list:
+    return (await _load(pool))[0]
+
+
+async def get_bots(pool: asyncpg.Pool) -> list:
+    return (await _load(pool))[1]
+
+
+async def get_active_channels(pool: asyncpg.Pool) -> list:
+    return (await _load(pool))[2]
+
+
+async def get_active_bots(pool: asyncpg.Pool) -> list:
+    return (await _load(pool))[3]
+
+
+def invalidate() -> None:
+    global _expires_at, _generation
+    _expires_at = 0
+    _generation += 1
@@ -0,0 +1,64 @@
+import asyncio
+import time
+import weakref
+
+from aiogram import Bot
+
+from src.app.common.member_statuses import MEMBER_STATUSES
+
+SUB_CACHE_TTL = 10
+SUB_CACHE_MAX_SIZE = 10_000
+
+# (user_id, channel_id) -> expires_at; кэшируются только подтверждённые подписки,
+# чтобы только что подписавшийся пользователь не блокировался до истечения TTL
+_user_subscribed: dict[tuple[int, int], float] = {}
+_locks: weakref.WeakValueDictionary[tuple[int, int], asyncio.Lock] = weakref.WeakValueDictionary()
+
+
+def _is_cached_subscribed(key: tuple[int, int]) -> bool:
+    expires_at = _user_subscribed.get(key)
+    if expires_at is None:
+        return False
+
+    if time.monotonic() > expires_at:
+        _user_subscribed.pop(key, None)
+        return False
+    return True
+
+
+async def is_missing(bot: Bot, channel_id: int, user_id: int) -> bool:
+    key = (user_id, channel_id)
+
+    if _is_cached_subscribed(key):
+        return False
+
+    lock = _locks.get(key)
+    if lock is None:
+        lock = _locks[key] = asyncio.Lock()
+
+    async with lock:
+        if _is_cached_subscribed(key):
+            return False
+
+        user_status = await bot.get_chat_member(channel_id, user_id)
+        missing = user_status.status not in MEMBER_STATUSES
+        if not missing:
+            now = time.monotonic()
+            _prune(now)
+            _user_subscribed[key] = now + SUB_CACHE_TTL
+        return missing
+
+
+def _prune(now: float) -> None:
+    # TTL постоянный, поэтому порядок вставки в dict совпадает с порядком истечения:
+    # удаляем с начала просроченные записи, а при переполнении — самые старые
+    while _user_subscribed:
+        oldest = next(iter(_user_subscribed))
+        if now <= _user_subscribed[oldest] and len(_user_subscribed) < SUB_CACHE_MAX_SIZE:
+            break
+        del _user_subscribed[oldest]
+
+
+def invalidate_channel(channel_id: int) -> None:
+    for key in [key for key in _user_subscribed if key[1] == channel_id]:
+        _user_subscribed.pop(key, None)
@@ -0,0 +1 @@
+MEMBER_STATUSES: frozenset[str] = frozenset(("member", "administrator", "creator"))
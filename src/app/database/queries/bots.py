@@ -10,7 +10,7 @@ class BotActions:
             bot_name: str,
             bot_username: str,
             bot_url: str,
-            bot_status: str = "True",
+            bot_status: bool = True,
     ):
         query = """
             INSERT INTO bots (bot_name, bot_username, bot_status, bot_url) VALUES($1, $2, $3, $4)      
@@ -25,20 +25,48 @@ class BotActions:
         async with self.pool.acquire() as conn:
             return await conn.fetchrow(query, bot_username)
 
+    async def get_bot_for_display(self, bot_username: str):
+        query = """
+            SELECT bot_name, bot_username, bot_status, bot_url FROM bots WHERE bot_username = $1
+        """
+        async with self.pool.acquire() as conn:
+            return await conn.fetchrow(query, bot_username)
+
+    async def bot_exists(self, bot_username: str) -> bool:
+        query = """
+            SELECT EXISTS(SELECT 1 FROM bots WHERE bot_username = $1)
+        """
+        async with self.pool.acquire() as conn:
+            return await conn.fetchval(query, bot_username)
+
     async def get_all_bots(self):
         query = """
-            SELECT * FROM bots
+            SELECT bot_name, bot_username FROM bots
         """
         async with self.pool.acquire() as conn:
             return await conn.fetch(query)
 
-    async def update_bot_status(self, new_bot_status: str, bot_username: str):
+    async def get_active_op_bots(self):
+        query = """
+            SELECT bot_name, bot_url FROM bots WHERE bot_status
+        """
+        async with self.pool.acquire() as conn:
+            return await conn.fetch(query)
+
+    async def update_bot_status(self, new_bot_status: bool, bot_username: str):
         query = """
             UPDATE bots SET bot_status = $1 WHERE bot_username = $2
         """
         async with self.pool.acquire() as conn:
             await conn.execute(query, new_bot_status, bot_username)
 
+    async def toggle_status(self, bot_username: str) -> bool | None:
+        query = """
+            UPDATE bots SET bot_status = NOT bot_status WHERE bot_username = $1 RETURNING bot_status
+        """
+        async with self.pool.acquire() as conn:
+            return await conn.fetchval(query, bot_username)
+
     async def delete_bot(self, bot_username: str):
         query = """
             DELETE FROM bots WHERE bot_username = $1 
@@ -11,7 +11,7 @@ class ChannelActions:
             channel_name: str,
             channel_username: str,
             channel_url: str,
-            channel_status: str = "True"
+            channel_status: bool = True
     ):
         query = """
             INSERT INTO channels(channel_id, channel_name, channel_username, channel_status, channel_url) VALUES($1, $2, $3, $4, $5)      
@@ -35,9 +35,31 @@ class ChannelActions:
         async with self.pool.acquire() as conn:
             return await conn.fetchrow(query, channel_id)
 
+    async def get_channel_for_display(self, channel_id: int):
+        query = """
+            SELECT channel_id, channel_name, channel_username, channel_status, channel_url
+            FROM channels WHERE channel_id = $1
+        """
+        async with self.pool.acquire() as conn:
+            return await conn.fetchrow(query, channel_id)
+
+    async def channel_exists(self, channel_id: int) -> bool:
+        query = """
+            SELECT EXISTS(SELECT 1 FROM channels WHERE channel_id = $1)
+        """
+        async with self.pool.acquire() as conn:
+            return await conn.fetchval(query, channel_id)
+
     async def get_all_channels(self):
         query = """
-            SELECT * FROM channels
+            SELECT channel_id, channel_name FROM channels
+        """
+        async with self.pool.acquire() as conn:
+            return await conn.fetch(query)
+
+    async def get_active_op_channels(self):
+        query = """
+            SELECT channel_id, channel_name, channel_url FROM channels WHERE channel_status
         """
         async with self.pool.acquire() as conn:
             return await conn.fetch(query)
@@ -49,13 +71,20 @@ class ChannelActions:
         async with self.pool.acquire() as conn:
             return await conn.fetchrow(query, channel_id)
 
-    async def update_channel_status(self, new_channel_status: str, channel_id: int):
+    async def update_channel_status(self, new_channel_status: bool, channel_id: int):
         query = """
             UPDATE channels SET channel_status = $1 WHERE channel_id = $2
         """
         async with self.pool.acquire() as conn:
             await conn.execute(query, new_channel_status, channel_id)
 
+    async def toggle_status(self, channel_id: int) -> bool | None:
+        query = """
+            UPDATE channels SET channel_status = NOT channel_status WHERE channel_id = $1 RETURNING channel_status
+        """
+        async with self.pool.acquire() as conn:
+            return await conn.fetchval(query, channel_id)
+
     async def delete_channel(self, channel_id: int):
         query = """
             DELETE FROM channels WHERE channel_id = $1 
@@ -10,6 +10,8 @@ async def create_database_tables(conn: Connection):
         await create_users_table(conn)
         await create_channels_table(conn)
         await create_bots_table(conn)
+        await migrate_op_status_columns(conn)
+        await create_op_status_indexes(conn)
     except Exception as e:
         print("ERROR", e)
 
@@ -33,7 +35,7 @@ async def create_channels_table(conn: Connection):
             channel_id BIGINT PRIMARY KEY NOT NULL,
             channel_name TEXT NOT NULL,
             channel_username TEXT,
-            channel_status TEXT NOT NULL,
+            channel_status BOOLEAN NOT NULL,
             message TEXT,
             channel_url TEXT,
             created_at TIMESTAMP WITHOUT TIME ZONE DEFAULT CURRENT_TIMESTAMP NOT NULL
@@ -46,7 +48,7 @@ async def create_bots_table(conn: Connection) -> None:
         CREATE TABLE IF NOT EXISTS bots(
             bot_name TEXT NOT NULL,
             bot_username TEXT NOT NULL,
-            bot_status TEXT NOT NULL,
+            bot_status BOOLEAN NOT NULL,
             bot_url TEXT NOT NULL,
             created_at TIMESTAMP WITHOUT TIME ZONE DEFAULT CURRENT_TIMESTAMP NOT NULL
         )
@@ -54,6 +56,36 @@ async def create_bots_table(conn: Connection) -> None:
 
     await conn.execute(query)
 
+async def migrate_op_status_columns(conn: Connection) -> None:
+    query = """
+        DO $$
+        BEGIN
+            IF (
+                SELECT data_type FROM information_schema.columns
+                WHERE table_name = 'channels' AND column_name = 'channel_status'
+            ) = 'text' THEN
+                ALTER TABLE channels
+                ALTER COLUMN channel_status TYPE BOOLEAN USING channel_status::BOOLEAN;
+            END IF;
+
+            IF (
+                SELECT data_type FROM information_schema.columns
+                WHERE table_name = 'bots' AND column_name = 'bot_status'
+            ) = 'text' THEN
+                ALTER TABLE bots
+                ALTER COLUMN bot_status TYPE BOOLEAN USING bot_status::BOOLEAN;
+            END IF;
+        END $$;
+    """
+    await conn.execute(query)
+
+async def create_op_status_indexes(conn: Connection) -> None:
+    query = """
+        CREATE INDEX IF NOT EXISTS channels_active_op_idx ON channels(channel_status) WHERE channel_status;
+        CREATE INDEX IF NOT EXISTS bots_active_op_idx ON bots(bot_status) WHERE bot_status;
+    """
+    await conn.execute(query)
+
 async def create_feature_films_table(conn: Connection):
     query = """
         CREATE TABLE IF NOT EXISTS feature_films(
@@ -1,12 +1,35 @@
+import asyncio
 from typing import Dict, Any
 
 import asyncpg
 from aiogram import MagicFilter
 from aiogram_dialog import DialogManager
 
+from src.app.cache import op_cache
 from src.app.database.queries.bots import BotActions
 from src.app.database.queries.channels import ChannelActions
 
+# Индексируются значением is_in_op (False -> 0, True -> 1)
+_OP_BUTTONS = ("➕ Добавить в ОП", "🚫 Убрать из ОП")
+_OP_STATUS_LABELS = ("❌ Неактивен", "✅ Активен")
+
+_CHANNEL_INFO_TMPL = (
+    "📢 <b>Полная информация о канале</b>\n\n"
+    "🆔 <b>ID:</b> <code>{channel_id}</code>\n"
+    "📛 <b>Название:</b> {channel_name}\n"
+    "🔗 <b>Username:</b> @{channel_username}\n"
+    "📶 <b>Статус в ОП:</b> {status_label}\n"
+    "🔗 <b>Ссылка:</b> {channel_url}\n"
+)
+
+_BOT_INFO_TMPL = (
+    "🤖 <b>Полная информация о боте</b>\n\n"
+    "📛 <b>Название:</b> {bot_name}\n"
+    "🔗 <b>Username:</b> @{bot_username}\n"
+    "📶 <b>Статус в ОП:</b> {status_label}\n"
+    "🔗 <b>Ссылка:</b> {bot_url}\n"
+)
+
 
 # ==================== OP MENU GETTERS ====================
 
@@ -19,13 +42,11 @@ async def get_op_menu_data(dialog_manager: DialogManager, **_) -> Dict[str, Any]
     """
     pool: asyncpg.Pool = dialog_manager.middleware_data["pool"]
 
-    # Получаем все каналы
-    channel_actions = ChannelActions(pool)
-    channels = await channel_actions.get_all_channels()
-
-    # Получаем всех ботов
-    bot_actions = BotActions(pool)
-    bots = await bot_actions.get_all_bots()
+    # Получаем все каналы и ботов параллельно
+    channels, bots = await asyncio.gather(
+        op_cache.get_channels(pool),
+        op_cache.get_bots(pool)
+    )
 
     # Определяем тип сообщения
     msg_type = "not_found" if not channels and not bots else "start_msg"
@@ -64,11 +85,10 @@ async def get_channel_info_data(dialog_manager: DialogManager, **_) -> Dict[str,
     channel_id = dialog_manager.start_data.get("channel_id")
     dialog_manager.dialog_data["channel_id"] = channel_id
 
-    pool: asyncpg.Pool = dialog_manager.middleware_data["pool"]
-    channel_actions = ChannelActions(pool)
+    channel_actions: ChannelActions = dialog_manager.middleware_data["channel_actions"]
 
     # Получаем данные канала из БД
-    channel_data = await channel_actions.get_channel(channel_id)
+    channel_data = await channel_actions.get_channel_for_display(channel_id)
 
     if not channel_data:
         return {
@@ -77,18 +97,15 @@ async def get_channel_info_data(dialog_manager: DialogManager, **_) -> Dict[str,
         }
 
     # Определяем текст кнопки в зависимости от статуса
-    is_in_op = channel_data[3] == "True"
-    op_button = "🚫 Убрать из ОП" if is_in_op else "➕ Добавить в ОП"
+    is_in_op = channel_data["channel_status"]
+    op_button = _OP_BUTTONS[is_in_op]
 
     # Форматируем данные для отображения
-    channel_info = (
-        "📢 <b>Полная информация о канале</b>\n\n"
-        f"🆔 <b>ID:</b> <code>{channel_data[0]}</code>\n"
-        f"📛 <b>Название:</b> {channel_data[1]}\n"
-        f"🔗 <b>Username:</b> @{channel_data[2] or 'не указан'}\n"
-        f"📶 <b>Статус в ОП:</b> {'✅ Активен' if is_in_op else '❌ Неактивен'}\n"
-        f"🔗 <b>Ссылка:</b> {channel_data[5]}\n"
-    )
+    channel_info = _CHANNEL_INFO_TMPL.format_map({
+        **channel_data,
+        "channel_username": channel_data["channel_username"] or "не указан",
+        "status_label": _OP_STATUS_LABELS[is_in_op]
+    })
 
     return {
         "channel_data": channel_info,
@@ -121,11 +138,10 @@ async def get_bot_info_data(dialog_manager: DialogManager, **_) -> Dict[str, str
     bot_username = dialog_manager.start_data.get("bot_username")
     dialog_manager.dialog_data["bot_username"] = bot_username
 
-    pool: asyncpg.Pool = dialog_manager.middleware_data["pool"]
-    bot_actions = BotActions(pool)
+    bot_actions: BotActions = dialog_manager.middleware_data["bot_actions"]
 
     # Получаем данные бота из БД
-    bot_data = await bot_actions.get_bot(bot_username)
+    bot_data = await bot_actions.get_bot_for_display(bot_username)
 
     if not bot_data:
         return {
@@ -134,17 +150,14 @@ async def get_bot_info_data(dialog_manager: DialogManager, **_) -> Dict[str, str
         }
 
     # Определяем текст кнопки в зависимости от статуса
-    is_in_op = bot_data[2] == "True"
-    op_button = "🚫 Убрать из ОП" if is_in_op else "➕ Добавить в ОП"
+    is_in_op = bot_data["bot_status"]
+    op_button = _OP_BUTTONS[is_in_op]
 
     # Форматируем данные для отображения
-    bot_info = (
-        "🤖 <b>Полная информация о боте</b>\n\n"
-        f"📛 <b>Название:</b> {bot_data[0]}\n"
-        f"🔗 <b>Username:</b> @{bot_data[1]}\n"
-        f"📶 <b>Статус в ОП:</b> {'✅ Активен' if is_in_op else '❌ Неактивен'}\n"
-        f"🔗 <b>Ссылка:</b> {bot_data[3]}\n"
-    )
+    bot_info = _BOT_INFO_TMPL.format_map({
+        **bot_data,
+        "status_label": _OP_STATUS_LABELS[is_in_op]
+    })
 
     return {
         "bot_data": bot_info,
@@ -14,6 +14,7 @@ import asyncpg
 from aiogram.types import CallbackQuery, Message
 from aiogram_dialog import DialogManager
 
+from src.app.cache import op_cache, sub_cache
 from src.app.database.queries.bots import BotActions
 from src.app.database.queries.channels import ChannelActions
 from src.app.keyboards.inline import admin_menu
@@ -21,6 +22,8 @@ from src.app.states.admin.channel import OPMenu, ChannelMenu, AddChannelState, A
 
 logger = logging.getLogger(__name__)
 
+ADMIN_MENU_TEXT = "🔧 Выберите действие"
+
 
 # ==================== CHANNEL HANDLERS ====================
 
@@ -41,27 +44,24 @@ async def handle_channel_forward(
         message: Forwarded message from channel
         dialog_manager: Current dialog state manager
     """
-    pool: asyncpg.Pool = dialog_manager.middleware_data["pool"]
-
     # Check if message is forwarded from a channel
     if not message.forward_from_chat:
         dialog_manager.dialog_data["msg_type"] = "not_forwarded"
         logger.warning("User attempted to add channel without forwarding a message")
         return
 
-    channel_actions = ChannelActions(pool)
+    channel_actions: ChannelActions = dialog_manager.middleware_data["channel_actions"]
     channel_id = message.forward_from_chat.id
 
     # Check if channel already exists
     try:
-        existing_channel = await channel_actions.get_channel(channel_id)
-        if existing_channel:
+        if await channel_actions.channel_exists(channel_id):
             dialog_manager.dialog_data["msg_type"] = "already_exists"
             await dialog_manager.switch_to(AddChannelState.get_channel_link)
-            logger.info(f"Channel {channel_id} already exists in database")
+            logger.info("Channel %s already exists in database", channel_id)
             return
     except Exception as e:
-        logger.error(f"Error checking channel existence: {e}")
+        logger.error("Error checking channel existence: %s", e)
         dialog_manager.dialog_data["msg_type"] = "error"
         return
 
@@ -72,7 +72,7 @@ async def handle_channel_forward(
         "channel_username": message.forward_from_chat.username or ""
     }
     dialog_manager.dialog_data["channel_data"] = channel_data
-    logger.info(f"Channel data extracted: {channel_data['channel_name']} ({channel_id})")
+    logger.info("Channel data extracted: %s (%s)", channel_data["channel_name"], channel_id)
 
     await dialog_manager.switch_to(AddChannelState.get_channel_link)
 
@@ -96,8 +96,7 @@ async def handle_channel_url_input(
         logger.warning("User sent non-text message as channel URL")
         return
 
-    pool: asyncpg.Pool = dialog_manager.middleware_data["pool"]
-    channel_actions = ChannelActions(pool)
+    channel_actions: ChannelActions = dialog_manager.middleware_data["channel_actions"]
     channel_data = dialog_manager.dialog_data.get("channel_data")
 
     if not channel_data:
@@ -117,17 +116,18 @@ async def handle_channel_url_input(
             channel_url=channel_url
         )
         logger.info(
-            f"✅ Channel added successfully: {channel_data['channel_name']} "
-            f"({channel_data['channel_id']}) - {channel_url}"
+            "✅ Channel added successfully: %s (%s) - %s",
+            channel_data["channel_name"], channel_data["channel_id"], channel_url
         )
+        op_cache.invalidate()
 
     except asyncpg.UniqueViolationError:
-        logger.warning(f"Channel {channel_data['channel_id']} already exists (unique violation)")
+        logger.warning("Channel %s already exists (unique violation)", channel_data["channel_id"])
         dialog_manager.dialog_data["msg_type"] = "already_exists"
         return
 
     except Exception as e:
-        logger.error(f"❌ Error adding channel {channel_data['channel_id']}: {e}", exc_info=True)
+        logger.error("❌ Error adding channel %s: %s", channel_data["channel_id"], e, exc_info=True)
         dialog_manager.dialog_data["msg_type"] = "error"
         return
 
@@ -151,13 +151,13 @@ async def handle_get_channel_info(
     """
     try:
         channel_id = int(item_id)
-        logger.debug(f"Opening channel info for ID: {channel_id}")
+        logger.debug("Opening channel info for ID: %s", channel_id)
         await dialog_manager.start(
             ChannelMenu.menu,
             data={"channel_id": channel_id}
         )
     except ValueError:
-        logger.error(f"Invalid channel ID format: {item_id}")
+        logger.error("Invalid channel ID format: %s", item_id)
 
 
 async def handle_delete_channel(
@@ -171,7 +171,6 @@ async def handle_delete_channel(
     Args:
         manager: Current dialog state manager
     """
-    pool: asyncpg.Pool = manager.middleware_data["pool"]
     channel_id = manager.dialog_data.get("channel_id")
 
     if not channel_id:
@@ -179,13 +178,15 @@ async def handle_delete_channel(
         await manager.start(OPMenu.menu)
         return
 
-    channel_actions = ChannelActions(pool)
+    channel_actions: ChannelActions = manager.middleware_data["channel_actions"]
 
     try:
         await channel_actions.delete_channel(channel_id)
-        logger.info(f"✅ Channel {channel_id} deleted successfully")
+        op_cache.invalidate()
+        sub_cache.invalidate_channel(channel_id)
+        logger.info("✅ Channel %s deleted successfully", channel_id)
     except Exception as e:
-        logger.error(f"❌ Error deleting channel {channel_id}: {e}", exc_info=True)
+        logger.error("❌ Error deleting channel %s: %s", channel_id, e, exc_info=True)
 
     await manager.start(OPMenu.menu)
 
@@ -198,38 +199,32 @@ async def handle_toggle_channel_op_status(
     """
     Toggle channel's OP status (active/inactive).
 
-    Switches between "True" and "False" status states.
+    Flips the status in a single UPDATE ... RETURNING query.
 
     Args:
         manager: Current dialog state manager
     """
-    pool: asyncpg.Pool = manager.middleware_data["pool"]
     channel_id = manager.dialog_data.get("channel_id")
 
     if not channel_id:
         logger.error("Channel ID not found in dialog_data for status toggle")
         return
 
-    channel_actions = ChannelActions(pool)
+    channel_actions: ChannelActions = manager.middleware_data["channel_actions"]
 
     try:
-        channel_data = await channel_actions.get_channel(channel_id)
+        new_status = await channel_actions.toggle_status(channel_id)
 
-        if not channel_data:
-            logger.error(f"Channel {channel_id} not found in database")
+        if new_status is None:
+            logger.error("Channel %s not found in database", channel_id)
             return
 
-        # Toggle status: "True" <-> "False"
-        current_status = channel_data[3]
-        new_status = "False" if current_status == "True" else "True"
-
-        await channel_actions.update_channel_status(new_status, channel_id)
-        logger.info(
-            f"✅ Channel {channel_id} status changed: {current_status} -> {new_status}"
-        )
+        op_cache.invalidate()
+        sub_cache.invalidate_channel(channel_id)
+        logger.info("✅ Channel %s status changed to %s", channel_id, new_status)
 
     except Exception as e:
-        logger.error(f"❌ Error toggling channel {channel_id} status: {e}", exc_info=True)
+        logger.error("❌ Error toggling channel %s status: %s", channel_id, e, exc_info=True)
 
     await manager.switch_to(ChannelMenu.menu)
 
@@ -258,27 +253,25 @@ async def handle_bot_username_input(
         logger.warning("User sent non-text message as bot username")
         return
 
-    pool: asyncpg.Pool = dialog_manager.middleware_data["pool"]
-    bot_actions = BotActions(pool)
+    bot_actions: BotActions = dialog_manager.middleware_data["bot_actions"]
 
     # Clean username: remove @ symbol if present
     bot_username = message.text.strip().lstrip("@")
 
     # Check if bot already exists
     try:
-        existing_bot = await bot_actions.get_bot(bot_username)
-        if existing_bot:
+        if await bot_actions.bot_exists(bot_username):
             dialog_manager.dialog_data["msg_type"] = "already_exists"
-            logger.info(f"Bot @{bot_username} already exists in database")
+            logger.info("Bot @%s already exists in database", bot_username)
             return
     except Exception as e:
-        logger.error(f"Error checking bot existence: {e}")
+        logger.error("Error checking bot existence: %s", e)
         dialog_manager.dialog_data["msg_type"] = "error"
         return
 
     # Store username for next step
     dialog_manager.dialog_data["bot_username"] = bot_username
-    logger.info(f"Bot username stored: @{bot_username}")
+    logger.info("Bot username stored: @%s", bot_username)
 
     await dialog_manager.switch_to(AddBotState.get_bot_link)
 
@@ -302,7 +295,8 @@ async def handle_bot_url_input(
 
     bot_url = message.text.strip()
     dialog_manager.dialog_data["bot_url"] = bot_url
-    logger.debug(f"Bot URL stored: {bot_url}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Bot URL stored: %s", bot_url)
 
     await dialog_manager.switch_to(AddBotState.get_bot_name)
 
@@ -327,7 +321,7 @@ async def handle_default_bot_url(
     # Generate standard Telegram bot URL
     bot_url = f"https://t.me/{bot_username}"
     dialog_manager.dialog_data["bot_url"] = bot_url
-    logger.info(f"Default bot URL set: {bot_url}")
+    logger.info("Default bot URL set: %s", bot_url)
 
     await dialog_manager.switch_to(AddBotState.get_bot_name)
 
@@ -351,8 +345,7 @@ async def handle_bot_name_input(
         logger.warning("User sent non-text message as bot name")
         return
 
-    pool: asyncpg.Pool = dialog_manager.middleware_data["pool"]
-    bot_actions = BotActions(pool)
+    bot_actions: BotActions = dialog_manager.middleware_data["bot_actions"]
 
     bot_name = message.text.strip()
     bot_username = dialog_manager.dialog_data.get("bot_username")
@@ -360,7 +353,7 @@ async def handle_bot_name_input(
 
     # Validate all required data is present
     if not bot_username or not bot_url:
-        logger.error(f"Missing bot data - username: {bot_username}, url: {bot_url}")
+        logger.error("Missing bot data - username: %s, url: %s", bot_username, bot_url)
         dialog_manager.dialog_data["msg_type"] = "error"
         await dialog_manager.done()
         await dialog_manager.start(OPMenu.menu)
@@ -372,15 +365,16 @@ async def handle_bot_name_input(
             bot_username=bot_username,
             bot_url=bot_url
         )
-        logger.info(f"✅ Bot added successfully: {bot_name} (@{bot_username}) - {bot_url}")
+        op_cache.invalidate()
+        logger.info("✅ Bot added successfully: %s (@%s) - %s", bot_name, bot_username, bot_url)
 
     except asyncpg.UniqueViolationError:
-        logger.warning(f"Bot @{bot_username} already exists (unique violation)")
+        logger.warning("Bot @%s already exists (unique violation)", bot_username)
         dialog_manager.dialog_data["msg_type"] = "already_exists"
         return
 
     except Exception as e:
-        logger.error(f"❌ Error adding bot @{bot_username}: {e}", exc_info=True)
+        logger.error("❌ Error adding bot @%s: %s", bot_username, e, exc_info=True)
         dialog_manager.dialog_data["msg_type"] = "error"
         return
 
@@ -402,7 +396,7 @@ async def handle_get_bot_info(
         dialog_manager: Current dialog state manager
         item_id: Bot username
     """
-    logger.debug(f"Opening bot info for username: {item_id}")
+    logger.debug("Opening bot info for username: %s", item_id)
     await dialog_manager.start(
         BotMenu.menu,
         data={"bot_username": item_id}
@@ -420,7 +414,6 @@ async def handle_delete_bot(
     Args:
         manager: Current dialog state manager
     """
-    pool: asyncpg.Pool = manager.middleware_data["pool"]
     bot_username = manager.dialog_data.get("bot_username")
 
     if not bot_username:
@@ -428,13 +421,14 @@ async def handle_delete_bot(
         await manager.start(OPMenu.menu)
         return
 
-    bot_actions = BotActions(pool)
+    bot_actions: BotActions = manager.middleware_data["bot_actions"]
 
     try:
         await bot_actions.delete_bot(bot_username)
-        logger.info(f"✅ Bot @{bot_username} deleted successfully")
+        op_cache.invalidate()
+        logger.info("✅ Bot @%s deleted successfully", bot_username)
     except Exception as e:
-        logger.error(f"❌ Error deleting bot @{bot_username}: {e}", exc_info=True)
+        logger.error("❌ Error deleting bot @%s: %s", bot_username, e, exc_info=True)
 
     await manager.start(OPMenu.menu)
 
@@ -447,38 +441,31 @@ async def handle_toggle_bot_op_status(
     """
     Toggle bot's OP status (active/inactive).
 
-    Switches between "True" and "False" status states.
+    Flips the status in a single UPDATE ... RETURNING query.
 
     Args:
         manager: Current dialog state manager
     """
-    pool: asyncpg.Pool = manager.middleware_data["pool"]
     bot_username = manager.dialog_data.get("bot_username")
 
     if not bot_username:
         logger.error("Bot username not found in dialog_data for status toggle")
         return
 
-    bot_actions = BotActions(pool)
+    bot_actions: BotActions = manager.middleware_data["bot_actions"]
 
     try:
-        bot_data = await bot_actions.get_bot(bot_username)
+        new_status = await bot_actions.toggle_status(bot_username)
 
-        if not bot_data:
-            logger.error(f"Bot @{bot_username} not found in database")
+        if new_status is None:
+            logger.error("Bot @%s not found in database", bot_username)
             return
 
-        # Toggle status: "True" <-> "False"
-        current_status = bot_data[2]
-        new_status = "False" if current_status == "True" else "True"
-
-        await bot_actions.update_bot_status(new_status, bot_username)
-        logger.info(
-            f"✅ Bot @{bot_username} status changed: {current_status} -> {new_status}"
-        )
+        op_cache.invalidate()
+        logger.info("✅ Bot @%s status changed to %s", bot_username, new_status)
 
     except Exception as e:
-        logger.error(f"❌ Error toggling bot @{bot_username} status: {e}", exc_info=True)
+        logger.error("❌ Error toggling bot @%s status: %s", bot_username, e, exc_info=True)
 
     await manager.switch_to(BotMenu.menu)
 
@@ -501,9 +488,9 @@ async def handle_dialog_done(
 
     try:
         await call.message.edit_text(
-            text="🔧 Выберите действие",
+            text=ADMIN_MENU_TEXT,
             reply_markup=admin_menu
         )
         logger.debug("Dialog closed, returned to admin menu")
     except Exception as e:
-        logger.error(f"Error editing message on dialog close: {e}")
+        logger.error("Error editing message on dialog close: %s", e)
@@ -3,21 +3,17 @@ from aiogram import Bot
 from aiogram.filters import BaseFilter
 from aiogram.types import Message, CallbackQuery
 
-from src.app.database.queries.channels import ChannelActions
+from src.app.cache import op_cache, sub_cache
 
 
 class CheckSubscription(BaseFilter):
     async def __call__(self, event: Message | CallbackQuery, pool: asyncpg.Pool, bot: Bot, **kwargs):
-        channel_actions = ChannelActions(pool)
-        channel_data = await channel_actions.get_all_channels()
+        channel_data = await op_cache.get_active_channels(pool)
 
         if not channel_data:
             return False
 
         for channel in channel_data:
-
-            if channel[3] == "True":
-                user_status = await bot.get_chat_member(channel[0], event.from_user.id)
-                if user_status.status not in ["member", "administrator", "creator"]:
-                    return True
+            if await sub_cache.is_missing(bot, channel["channel_id"], event.from_user.id):
+                return True
         return False
@@ -3,6 +3,7 @@ from aiogram import Router, F, Bot
 from aiogram.types import CallbackQuery
 from aiogram_dialog import DialogManager
 
+from src.app.common.member_statuses import MEMBER_STATUSES
 from src.app.database.queries.bots import BotActions
 from src.app.database.queries.channels import ChannelActions
 from src.app.database.queries.user import UserActions
@@ -17,39 +18,26 @@ async def check_channel_sub(
         dialog_manager: DialogManager,
         pool: asyncpg.Pool,
         bot: Bot,
+        channel_actions: ChannelActions,
+        bot_actions: BotActions,
 ):
-    channel_actions = ChannelActions(pool)
-    bot_actions = BotActions(pool)
     user_actions = UserActions(pool)
 
     user_data = await user_actions.get_user(call.from_user.id)
-    channel_data = await channel_actions.get_all_channels()
-    bot_data = await bot_actions.get_all_bots()
+    channel_data = await channel_actions.get_active_op_channels()
+    not_sub_bots = await bot_actions.get_active_op_bots()
     not_sub_channels = []
-    not_sub_bots = []
 
     # Проверка подписки на обязательные каналы
     for channel in channel_data:
-        # channel[3] должен быть boolean True, а не строкой "True"
-        if channel[3] is True or channel[3] == "True":
-            try:
-                user_status = await bot.get_chat_member(channel[0], call.from_user.id)
-                if user_status.status not in ["member", "administrator", "creator"]:
-                    not_sub_channels.append(channel)
-            except Exception as e:
-                # Если канал не найден или возникла ошибка
-                print(f"Ошибка при проверке канала {channel[0]}: {e}")
-                continue
-
-    for bot in bot_data:
-        # channel[3] должен быть boolean True, а не строкой "True"
-        if bot[2] is True or bot[2] == "True":
-            try:
-                not_sub_bots.append(bot)
-            except Exception as e:
-                # Если канал не найден или возникла ошибка
-                print(f"Ошибка при проверке канала {bot[0]}: {e}")
-                continue
+        try:
+            user_status = await bot.get_chat_member(channel["channel_id"], call.from_user.id)
+            if user_status.status not in MEMBER_STATUSES:
+                not_sub_channels.append(channel)
+        except Exception as e:
+            # Если канал не найден или возникла ошибка
+            print(f"Ошибка при проверке канала {channel['channel_id']}: {e}")
+            continue
 
     # Если пользователь подписан на все каналы
     if not not_sub_channels:
@@ -1,52 +1,60 @@
+import asyncio
+import logging
+
 import asyncpg
 from aiogram import Router, Bot
 from aiogram.types import Message, CallbackQuery
 
-from src.app.database.queries.bots import BotActions
-from src.app.database.queries.channels import ChannelActions
+from src.app.cache import op_cache, sub_cache
 from src.app.filters.check_channel_sub import CheckSubscription
 from src.app.keyboards.inline import not_channels_button
 
+logger = logging.getLogger(__name__)
+
 check_channel_sub_router = Router()
 check_channel_sub_router.message.filter(CheckSubscription())
 check_channel_sub_router.callback_query.filter(CheckSubscription())
 
 
-@check_channel_sub_router.message()
-async def check_channel_sub_message(message: Message, pool: asyncpg.Pool, bot: Bot):
-    channel_actions = ChannelActions(pool)
-    bot_actions = BotActions(pool)
-    channel_data = await channel_actions.get_all_channels()
-    bot_actions = await bot_actions.get_all_bots()
+async def _collect_unsub_channels(bot: Bot, channels, user_id: int) -> list:
+    results = await asyncio.gather(
+        *(sub_cache.is_missing(bot, channel["channel_id"], user_id) for channel in channels),
+        return_exceptions=True
+    )
 
     not_sub_channels = []
-    for channel in channel_data:
-        if channel[3] == "True":
-            user_status = await bot.get_chat_member(channel[0], message.from_user.id)
-            if user_status.status not in ["member", "administrator", "creator"]:
-                not_sub_channels.append(channel)
+    for channel, missing in zip(channels, results):
+        if isinstance(missing, BaseException):
+            # Канал недоступен боту (бот удалён, канал удалён и т.п.) — пропускаем
+            logger.warning("Error checking subscription to channel %s: %s", channel["channel_id"], missing)
+            continue
+        if missing:
+            not_sub_channels.append(channel)
+
+    return not_sub_channels
 
 
+@check_channel_sub_router.message()
+async def check_channel_sub_message(message: Message, pool: asyncpg.Pool, bot: Bot):
+    channel_data = await op_cache.get_active_channels(pool)
+    not_sub_bots = await op_cache.get_active_bots(pool)
+
+    not_sub_channels = await _collect_unsub_channels(bot, channel_data, message.from_user.id)
+
     await message.answer(
         "Botdan foydalanish uchun ushbu kanallarga obuna bo'ling",
-        reply_markup=not_channels_button(not_sub_channels, bot_actions)
+        reply_markup=not_channels_button(not_sub_channels, not_sub_bots)
     )
 
 
 @check_channel_sub_router.callback_query()
 async def check_channel_sub_call(call: CallbackQuery, pool: asyncpg.Pool, bot: Bot):
-    channel_actions = ChannelActions(pool)
-    bot_actions = BotActions(pool)
-    channel_data = await channel_actions.get_all_channels()
-    bot_actions = await bot_actions.get_all_bots()
-    not_sub_channels = []
-    for channel in channel_data:
-        if channel[3] == "True":
-            user_status = await bot.get_chat_member(channel[0], call.from_user.id)
-            if user_status.status not in ["member", "administrator", "creator"]:
-                not_sub_channels.append(channel)
+    channel_data = await op_cache.get_active_channels(pool)
+    not_sub_bots = await op_cache.get_active_bots(pool)
+
+    not_sub_channels = await _collect_unsub_channels(bot, channel_data, call.from_user.id)
 
     await call.message.answer(
         "Botdan foydalanish uchun ushbu kanallarga obuna bo'ling",
-        reply_markup=not_channels_button(not_sub_channels, bot_actions)
+        reply_markup=not_channels_button(not_sub_channels, not_sub_bots)
     )
@@ -483,12 +483,12 @@ def not_channels_button(channel_data, bots_data):
     for bot in bots_data:
 
         builder_button.row(
-            InlineKeyboardButton(text=bot[0], url=bot[3])
+            InlineKeyboardButton(text=bot["bot_name"], url=bot["bot_url"])
         )
     for channel in channel_data:
 
         builder_button.row(
-            InlineKeyboardButton(text=channel[1], url=channel[5])
+            InlineKeyboardButton(text=channel["channel_name"], url=channel["channel_url"])
         )
 
     builder_button.row(InlineKeyboardButton(text="✅", callback_data="check_sub"))
@@ -25,6 +25,8 @@ async def main():
 
     pool = await asyncpg.create_pool(
         dsn,
+        statement_cache_size=1024,
+        max_cached_statement_lifetime=0,
     )
     async with pool.acquire() as conn:
         await create_database_tables(conn)
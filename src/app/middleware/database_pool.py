@@ -4,10 +4,15 @@ import asyncpg
 from aiogram import BaseMiddleware
 from aiogram.types import TelegramObject, CallbackQuery, Message
 
+from src.app.database.queries.bots import BotActions
+from src.app.database.queries.channels import ChannelActions
+
 
 class DatabaseMiddleware(BaseMiddleware):
     def __init__(self, pool: asyncpg.Pool):
         self.pool = pool
+        self.channel_actions = ChannelActions(pool)
+        self.bot_actions = BotActions(pool)
 
     async def __call__(
         self,
@@ -17,4 +22,6 @@ class DatabaseMiddleware(BaseMiddleware):
     ) -> Any:
 
         data["pool"] = self.pool
+        data["channel_actions"] = self.channel_actions
+        data["bot_actions"] = self.bot_actions
         return await handler(event, data)
\ No newline at end of file